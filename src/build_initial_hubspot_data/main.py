@@ -1,22 +1,40 @@
 """Project main entry point."""
 
+import functools
+import json
 import logging
 import os
 import re
 import sys
 import urllib.parse
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import NewType, NoReturn
+from typing import NewType, NoReturn, Self
 
 import boto3
+import ijson
+import numpy as np
 import pandas as pd
 import requests
 from boto3.dynamodb.conditions import Key
+from botocore.config import Config
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads
 
 logger = logging.getLogger()
 logger.setLevel('INFO')
 
+# Avoid the defensive copies of intermediate DataFrames (default in pandas 3)
+pd.options.mode.copy_on_write = True
+
 load_dotenv()
 
 
@@ -67,6 +85,15 @@ class ControlCenterApi:
     Thing = NewType('Thing', dict)
     Things = NewType('Things', list[Thing])
     Headers = NewType('Headers', dict)
+    POOL_SIZE = 32
+    MAX_CONCURRENT_REQUESTS = 10
+    RETRY = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET'],
+        respect_retry_after_header=True,
+    )
 
     def __init__(self, credentials: ControlCenterCredentials) -> None:
         """Initialize the API client with credentials.
@@ -77,8 +104,38 @@ class ControlCenterApi:
             Credentials for authentication
         """
         self.endpoint: ControlCenterCredentials.Endpoint = credentials.endpoint
+        # Endpoint URLs are resolved once instead of on every call
+        self._base_url = self.endpoint.geturl()
+        self._sensors_url = urllib.parse.urljoin(
+            self._base_url, '/api/get-sensors')
+        self._active_sensors_url = urllib.parse.urljoin(
+            self._base_url, '/api/activeSensors')
+        self._list_things_url = urllib.parse.urljoin(
+            self._base_url, '/api/listthing')
         self.headers: ControlCenterApi.Headers = ControlCenterApi.Headers(
             {'Authorization': f'Bearer {credentials.token}'})
+        # Keep-alive session so consecutive calls reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=ControlCenterApi.POOL_SIZE,
+            pool_maxsize=ControlCenterApi.POOL_SIZE,
+            max_retries=ControlCenterApi.RETRY,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def __enter__(self) -> Self:
+        """Use the client as a context manager closing its session on exit."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Close the client when leaving the context."""
+        self.close()
+
+    def close(self) -> None:
+        """Close the pooled connections of the session."""
+        self.session.close()
 
     def get(self, url: str, **params: str) -> dict:
         """Perform a GET request to the specified URL with authorization headers.
@@ -95,14 +152,14 @@ class ControlCenterApi:
         Any
             The JSON response from the API
         """
-        response = requests.get(
+        logger.debug('GET %s params=%s', url, params)
+        response = self.session.get(
             url,
-            headers=self.headers,
             params=params,
             timeout=30,
         )
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
     def get_sensors(self, status: str = 'all', args: str | None = None) -> 'ControlCenterApi.Sensors':
         """Retrieve sensors from the Control Center API.
@@ -119,9 +176,9 @@ class ControlCenterApi:
         Sensors
             List of sensors data from the API
         """
-        url = urllib.parse.urljoin(self.endpoint.geturl(), '/api/get-sensors')
-        response = self.get(url, status=status, args=args)
-        sensors_data = response.get('data', [])
+        response = self.get(self._sensors_url, status=status, args=args)
+        # 'data' may be present but null when there is no sensor
+        sensors_data = response.get('data') or []
         return ControlCenterApi.Sensors(sensors_data)
 
     def get_sensor(self, human_name: str, args: str | None = None) -> 'ControlCenterApi.Sensor':
@@ -140,7 +197,7 @@ class ControlCenterApi:
             Sensor data retrieved from the API as a custom type
         """
         url = urllib.parse.urljoin(
-            self.endpoint.geturl(), f'/api/v1/sensor/{human_name}')
+            self._base_url, f'/api/v1/sensor/{human_name}')
         return ControlCenterApi.Sensor(self.get(url, args=args))
 
     def get_active_sensors(self) -> 'ControlCenterApi.Sensors':
@@ -151,22 +208,27 @@ class ControlCenterApi:
         Sensors
             List of active sensors from the API
         """
-        url = urllib.parse.urljoin(
-            self.endpoint.geturl(), '/api/activeSensors')
-        response = self.get(url)
-        sensors_data = response.get('data', [])
+        response = self.get(self._active_sensors_url)
+        # 'data' may be present but null when there is no sensor
+        sensors_data = response.get('data') or []
         return ControlCenterApi.Sensors(sensors_data)
 
-    def list_things(self) -> 'ControlCenterApi.Things':
+    def list_things(self) -> Iterator['ControlCenterApi.Thing']:
         """List all things.
 
-        Returns
-        -------
-        Things
-            List of things from the API
+        The response array is parsed incrementally while it is downloaded,
+        so the whole JSON document is never held in memory.
+
+        Yields
+        ------
+        Thing
+            Each thing from the API
         """
-        url = urllib.parse.urljoin(self.endpoint.geturl(), '/api/listthing')
-        return ControlCenterApi.Things(self.get(url))
+        with self.session.get(self._list_things_url, stream=True, timeout=30) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            for thing in ijson.items(response.raw, 'item', use_float=True):
+                yield ControlCenterApi.Thing(thing)
 
     def get_sensor_all_things(self, human_name: str) -> 'ControlCenterApi.Things':
         """Retrieve all things associated with a given sensor.
@@ -185,45 +247,74 @@ class ControlCenterApi:
         all_things = response.get('sensor', {}).get('all_things', [])
         return ControlCenterApi.Things(all_things)
 
+    def get_sensors_all_things(self, human_names: Iterable[str]) -> list['ControlCenterApi.Things']:
+        """Retrieve all things of several sensors with concurrent requests.
+
+        Parameters
+        ----------
+        human_names : Iterable[str]
+            Human-readable names of the sensors
+
+        Returns
+        -------
+        list[Things]
+            List of all things for each sensor, in the order of human_names
+        """
+        # Bounded fan-out over the pooled session to avoid rate-limit storms
+        with ThreadPoolExecutor(max_workers=ControlCenterApi.MAX_CONCURRENT_REQUESTS) as executor:
+            return list(executor.map(self.get_sensor_all_things, human_names))
+
 
 Things = NewType('Things', pd.DataFrame)
+# Contiguous UTF-8 buffers for identifiers, so string ops and merges on them
+# run in Arrow kernels rather than on Python objects
+ARROW_STRING_DTYPE = pd.StringDtype('pyarrow')
 
 
-def things_to_dataframe(things: ControlCenterApi.Things) -> Things:
+def things_to_dataframe(things: Iterable[ControlCenterApi.Thing]) -> Things:
     """Transform things data into a pandas DataFrame.
 
     Parameters
     ----------
-    things : RawThings
-        List of thing dictionaries from the API
+    things : Iterable[Thing]
+        Thing dictionaries from the API, consumed in a single pass
 
     Returns
     -------
     ThingsDataFrame
         DataFrame with columns: prod_name, serial_number, production_date, latitude, longitude
     """
-    data: list[dict] = []
+    # One list per column, so pandas doesn't have to transpose row dicts
+    prod_names: list = []
+    serial_numbers: list = []
+    production_dates: list = []
+    updated_ats: list = []
+    latitudes: list = []
+    longitudes: list = []
 
     for thing in things:
-        prod_name = thing.get('id')
-        production_date = thing.get('created_at')
-        updated_at = thing.get('updated_at')
         current_value = thing.get('current_value', {})
         reported = current_value.get('reported', {})
-        serial_number = reported.get('SERIAL_NUMBER')
-        latitude = reported.get('COORDINATES_LAT')
-        longitude = reported.get('COORDINATES_LON')
+        prod_names.append(thing.get('id'))
+        serial_numbers.append(reported.get('SERIAL_NUMBER'))
+        production_dates.append(thing.get('created_at'))
+        updated_ats.append(thing.get('updated_at'))
+        latitudes.append(reported.get('COORDINATES_LAT'))
+        longitudes.append(reported.get('COORDINATES_LON'))
 
-        data.append({
-            'prod_name': prod_name,
-            'serial_number': serial_number,
-            'production_date': production_date,
-            'updated_at': updated_at,
-            'latitude': latitude,
-            'longitude': longitude,
-        })
+    return Things(pd.DataFrame({
+        'prod_name': pd.array(prod_names, dtype=ARROW_STRING_DTYPE),
+        'serial_number': pd.array(serial_numbers, dtype=ARROW_STRING_DTYPE),
+        'production_date': production_dates,
+        'updated_at': updated_ats,
+        'latitude': latitudes,
+        'longitude': longitudes,
+    }))
 
-    return Things(pd.DataFrame(data))
+
+# Captures the major and minor digits of 'muvtx_NMm_'; [0-9] rather than \d,
+# which also matches non-ASCII digits that pd.to_numeric can't parse
+_SERIAL_VERSION_RE = re.compile(r'muvtx_[0-9]([0-9])([0-9])_')
 
 
 def extract_version_from_serial(serial_number: str) -> str | None:
@@ -242,14 +333,10 @@ def extract_version_from_serial(serial_number: str) -> str | None:
     if not serial_number:
         return None
 
-    pattern = r'muvtx_(\d{3})_'
-    match = re.search(pattern, serial_number)
+    match = _SERIAL_VERSION_RE.search(serial_number)
 
     if match:
-        version_digits = match.group(1)
-
-        major = str(int(version_digits[1]))
-        minor = version_digits[2]
+        major, minor = match.groups()
         return f'{major}.{minor}'
 
     return None
@@ -267,11 +354,14 @@ def add_version_column(things: Things) -> None:
     -------
     None
     """
-    things['version'] = things['serial_number'].apply(
-        extract_version_from_serial)
+    # Vectorized equivalent of extract_version_from_serial over the column
+    parts = things['serial_number'].str.extract(_SERIAL_VERSION_RE)
+    version = parts[0] + '.' + parts[1]
+    things['version'] = version.astype('category')
 
 
 FEATURE_VERSION_THRESHOLD = 2.1  # Magic value for version threshold
+FEATURE_DTYPE = pd.CategoricalDtype(['Non', 'Oui'])
 
 
 def add_feature_columns(things: Things) -> None:
@@ -286,21 +376,17 @@ def add_feature_columns(things: Things) -> None:
     -------
     None
     """
-    def get_features(version_str: str | None) -> tuple[str, str, str]:
-        if version_str is None:
-            return 'Non', 'Non', 'Non'
-        try:
-            version_float = float(version_str)
-            if version_float >= FEATURE_VERSION_THRESHOLD:
-                return 'Oui', 'Oui', 'Oui'  # hauteur, temperature, image
-            return 'Oui', 'Non', 'Oui'  # hauteur, temperature, image
-        except (ValueError, TypeError):
-            # If version can't be converted to float, default to all 'Non'
-            return 'Non', 'Non', 'Non'
-
-    things[['hauteur', 'temperature', 'image']] = things['version'].apply(
-        lambda x: pd.Series(get_features(x)),
-    )
+    version = pd.to_numeric(things['version'], errors='coerce')
+    # Versions that can't be converted to float default to all 'Non'
+    known = version.notna()
+    above_threshold = version >= FEATURE_VERSION_THRESHOLD
+    # Boolean masks are directly the codes of FEATURE_DTYPE: 0 'Non', 1 'Oui'
+    things['hauteur'] = pd.Categorical.from_codes(
+        known.to_numpy(dtype=np.int8), dtype=FEATURE_DTYPE)
+    things['temperature'] = pd.Categorical.from_codes(
+        above_threshold.to_numpy(dtype=np.int8), dtype=FEATURE_DTYPE)
+    things['image'] = pd.Categorical.from_codes(
+        known.to_numpy(dtype=np.int8), dtype=FEATURE_DTYPE)
 
 
 Sensors = NewType('Sensors', pd.DataFrame)
@@ -317,17 +403,15 @@ def sensors_to_dataframe(sensors: ControlCenterApi.Sensors) -> Sensors:
     Returns
     -------
     SensorsDataFrame
-        DataFrame with columns: thing_id, human_name, etat
+        DataFrame with columns: prod_name, human_name
     """
-    data: list[dict] = []
-
-    for sensor in sensors:
-        thing_id = sensor.get('thing_active', {}).get('id')
-        data.append({
-            'prod_name': thing_id,
-            'human_name': sensor.get('human_name'),
-        })
-    return Sensors(pd.DataFrame(data))
+    prod_names = [(sensor.get('thing_active') or {}).get('id')
+                  for sensor in sensors]
+    human_names = [sensor.get('human_name') for sensor in sensors]
+    return Sensors(pd.DataFrame({
+        'prod_name': pd.array(prod_names, dtype=ARROW_STRING_DTYPE),
+        'human_name': pd.Categorical(human_names),
+    }))
 
 
 def add_human_name_column(things: Things, sensors: Sensors) -> Things:
@@ -343,15 +427,16 @@ def add_human_name_column(things: Things, sensors: Sensors) -> Things:
     Returns
     -------
     pd.DataFrame
-        DataFrame with added 'status' column
+        DataFrame with added 'human_name' column
     """
-
-    # Left join on prod_name = thing_id
-    return things.merge(
-        sensors,
-        on='prod_name',
-        how='left',
+    # Left join of prod_name on the sensors indexed by their active thing,
+    # sensors without an active thing can't match any thing
+    human_names = (
+        sensors
+        .dropna(subset=['prod_name'])
+        .set_index('prod_name')['human_name']
     )
+    return things.join(human_names, on='prod_name', how='left')
 
 
 def add_deactivation_date_column(things: Things) -> None:
@@ -367,11 +452,9 @@ def add_deactivation_date_column(things: Things) -> None:
     None
     """
 
-    # Add the deactivation date column using np.where for efficiency
-    things['deactivation_date'] = things.apply(
-        lambda row: row['updated_at'] if row['status'] == 'Out of order' else None,
-        axis=1,
-    )
+    # Vectorized mask instead of a row-wise apply
+    things['deactivation_date'] = things['updated_at'].where(
+        things['status'] == 'Out of order')
 
 
 class PayloadDatabase:
@@ -380,37 +463,81 @@ class PayloadDatabase:
     HumanName = NewType('HumanName', str)
     ProdNumber = NewType('ProdNumber', str)
     RawPayload = NewType('RawPayload', dict)
+    FirstLastPayloads = tuple[RawPayload | None, RawPayload | None]
     PAYLOAD_DATABASE_TABLE = 'metrics_prod'
+    MAX_WORKERS = 32
+    # Only attributes read by get_link_dates are fetched by the bulk query
+    FIRST_PAYLOAD_ATTRIBUTES = ('time_stamp', 'qnwinfo')
+    LAST_PAYLOAD_ATTRIBUTES = ('time_stamp',)
 
     def __init__(self) -> None:
         """Initialize the PayloadDatabase client."""
-        dynamodb = boto3.resource('dynamodb')
-        self.table = dynamodb.Table(PayloadDatabase.PAYLOAD_DATABASE_TABLE)
+        # The pool must be large enough for every worker to keep its connection
+        self.dynamodb = boto3.resource(
+            'dynamodb',
+            config=Config(max_pool_connections=PayloadDatabase.MAX_WORKERS),
+        )
+        self.table = self.dynamodb.Table(PayloadDatabase.PAYLOAD_DATABASE_TABLE)
+        # Workers query through the resource's client: unlike resources,
+        # clients are thread-safe, and this one still accepts Key conditions
+        self._client = self.dynamodb.meta.client
 
-    def get_first_payload(self, human_name: 'PayloadDatabase.HumanName', prod_number: 'PayloadDatabase.ProdNumber') -> RawPayload | None:
-        """Get the first payload for a sensor and prod_number.
+    def _query_payload(self, human_name: 'PayloadDatabase.HumanName', prod_number: 'PayloadDatabase.ProdNumber', *, scan_index_forward: bool, attributes: tuple[str, ...] | None = None) -> RawPayload | None:
+        """Query the oldest or newest payload for a sensor and prod_number.
 
         Parameters
         ----------
-        sensor : Sensor
-            The sensor human name as a custom type
-        prod_number : str
+        human_name : HumanName
+            The sensor human name
+        prod_number : ProdNumber
             The production number
+        scan_index_forward : bool
+            True to get the oldest payload, False to get the newest one
+        attributes : tuple[str, ...], optional
+            Only return these attributes of the payload (default is all)
 
         Returns
         -------
         Optional[RawPayload]
-            The first payload dictionary if found, otherwise None
+            The payload dictionary if found, otherwise None
         """
-        response = self.table.query(
+        projection = {}
+        if attributes:
+            # Placeholders, since attribute names may be DynamoDB reserved words
+            names = {f'#a{i}': name for i, name in enumerate(attributes)}
+            projection = {
+                'ProjectionExpression': ', '.join(names),
+                'ExpressionAttributeNames': names,
+            }
+        response = self._client.query(
+            TableName=PayloadDatabase.PAYLOAD_DATABASE_TABLE,
             IndexName='id-human_name-index',
             KeyConditionExpression=Key('id').eq(
                 prod_number) & Key('human_name').eq(human_name),
-            ScanIndexForward=True,
+            ScanIndexForward=scan_index_forward,
             Limit=1,
+            **projection,
         )
         return response['Items'][0] if response['Items'] else None
 
+    def get_first_payload(self, human_name: 'PayloadDatabase.HumanName', prod_number: 'PayloadDatabase.ProdNumber') -> RawPayload | None:
+        """Get the first payload for a sensor and prod_number.
+
+        Parameters
+        ----------
+        sensor : Sensor
+            The sensor human name as a custom type
+        prod_number : str
+            The production number
+
+        Returns
+        -------
+        Optional[RawPayload]
+            The first payload dictionary if found, otherwise None
+        """
+        return self._query_payload(
+            human_name, prod_number, scan_index_forward=True)
+
     def get_last_payload(self, human_name: 'PayloadDatabase.HumanName', prod_number: 'PayloadDatabase.ProdNumber') -> RawPayload | None:
         """Get the last payload for a sensor and prod_number.
 
@@ -426,30 +553,40 @@ class PayloadDatabase:
         Optional[RawPayload]
             The last payload dictionary if found, otherwise None
         """
-        response = self.table.query(
-            IndexName='id-human_name-index',
-            KeyConditionExpression=Key('id').eq(
-                prod_number) & Key('human_name').eq(human_name),
-            ScanIndexForward=False,
-            Limit=1,
+        return self._query_payload(
+            human_name, prod_number, scan_index_forward=False)
+
+    def _get_first_last_payloads(self, pair: tuple['PayloadDatabase.HumanName', 'PayloadDatabase.ProdNumber']) -> 'PayloadDatabase.FirstLastPayloads':
+        """Get the first and last payloads of a pair from a worker thread."""
+        human_name, prod_number = pair
+        return (
+            self._query_payload(
+                human_name, prod_number, scan_index_forward=True,
+                attributes=PayloadDatabase.FIRST_PAYLOAD_ATTRIBUTES),
+            self._query_payload(
+                human_name, prod_number, scan_index_forward=False,
+                attributes=PayloadDatabase.LAST_PAYLOAD_ATTRIBUTES),
         )
-        return response['Items'][0] if response['Items'] else None
 
+    def get_first_last_payloads_bulk(self, pairs: list[tuple['PayloadDatabase.HumanName', 'PayloadDatabase.ProdNumber']]) -> list['PayloadDatabase.FirstLastPayloads']:
+        """Get the first and last payloads for many sensor/prod_number pairs.
 
-def get_timestamp(payload: PayloadDatabase.RawPayload) -> pd.Timestamp | None:
-    """Get the link date for a specific sensor.
+        Queries are spread over a thread pool since they are bound by the
+        DynamoDB round-trip time.
 
-    Parameters
-    ----------
-    human_name : str
-        The human-readable name of the sensor
+        Parameters
+        ----------
+        pairs : list[tuple[HumanName, ProdNumber]]
+            The (sensor human name, production number) pairs to look up
 
-    Returns
-    -------
-    Optional[pd.Timestamp]
-        The link date if found, otherwise None
-    """
-    return payload['time_stamp']
+        Returns
+        -------
+        list[FirstLastPayloads]
+            The (first, last) payloads of each pair, in the order of pairs,
+            reduced to FIRST_PAYLOAD_ATTRIBUTES and LAST_PAYLOAD_ATTRIBUTES
+        """
+        with ThreadPoolExecutor(max_workers=PayloadDatabase.MAX_WORKERS) as executor:
+            return list(executor.map(self._get_first_last_payloads, pairs))
 
 
 PlmnCode = NewType('PlmnCode', str)
@@ -457,6 +594,9 @@ OperatorName = NewType('OperatorName', str)
 OperatorPlmnMappings = NewType('OperatorPlmnMappings', dict)
 
 
+_QNWINFO_PLMN_RE = re.compile(r'\+QNWINFO:\s*"[^"]*","(\d{5})",')
+
+
 def extract_plmn_code_from_qnwinfo(response: str) -> PlmnCode | None:
     """Extract the PLMN code from a +QNWINFO response string.
 
@@ -470,13 +610,32 @@ def extract_plmn_code_from_qnwinfo(response: str) -> PlmnCode | None:
     PlmnCode | None
         The extracted PLMN code, or None if not found
     """
-    pattern = r'\+QNWINFO:\s*"[^"]*","(\d{5})",'
-    match = re.search(pattern, response)
+    match = _QNWINFO_PLMN_RE.search(response)
     if match:
         return PlmnCode(match.group(1))
     return None
 
 
+_OPERATOR_PLMN_MAPPINGS = OperatorPlmnMappings({
+    PlmnCode('20801'): OperatorName('Orange'),
+    PlmnCode('20810'): OperatorName('SFR'),
+    PlmnCode('20815'): OperatorName('Free'),
+    PlmnCode('20820'): OperatorName('Bouygues Telecom'),
+    PlmnCode('21407'): OperatorName('Movistar'),
+    PlmnCode('21901'): OperatorName('T-Mobile'),
+    PlmnCode('21902'): OperatorName('Telemach / Tele2'),
+    PlmnCode('21910'): OperatorName('A1 / VIP'),
+    PlmnCode('22210'): OperatorName('Vodafone'),
+    PlmnCode('22288'): OperatorName('WindTre / WIND'),
+    PlmnCode('23420'): OperatorName('3'),
+    PlmnCode('26201'): OperatorName('T-mobile'),
+    PlmnCode('50501'): OperatorName('Telstra'),
+    PlmnCode('60400'): OperatorName('Orange'),
+    PlmnCode('61701'): OperatorName('my.t mobile'),
+    PlmnCode('61710'): OperatorName('Emtel'),
+})
+
+
 def get_operator_plmn_mappings() -> OperatorPlmnMappings:
     """Return the mapping of PLMN codes to operator names.
 
@@ -485,24 +644,7 @@ def get_operator_plmn_mappings() -> OperatorPlmnMappings:
     OperatorPlmnMappings
         Dictionary mapping PLMN code to operator name
     """
-    return OperatorPlmnMappings({
-        PlmnCode('20801'): OperatorName('Orange'),
-        PlmnCode('20810'): OperatorName('SFR'),
-        PlmnCode('20815'): OperatorName('Free'),
-        PlmnCode('20820'): OperatorName('Bouygues Telecom'),
-        PlmnCode('21407'): OperatorName('Movistar'),
-        PlmnCode('21901'): OperatorName('T-Mobile'),
-        PlmnCode('21902'): OperatorName('Telemach / Tele2'),
-        PlmnCode('21910'): OperatorName('A1 / VIP'),
-        PlmnCode('22210'): OperatorName('Vodafone'),
-        PlmnCode('22288'): OperatorName('WindTre / WIND'),
-        PlmnCode('23420'): OperatorName('3'),
-        PlmnCode('26201'): OperatorName('T-mobile'),
-        PlmnCode('50501'): OperatorName('Telstra'),
-        PlmnCode('60400'): OperatorName('Orange'),
-        PlmnCode('61701'): OperatorName('my.t mobile'),
-        PlmnCode('61710'): OperatorName('Emtel'),
-    })
+    return _OPERATOR_PLMN_MAPPINGS
 
 
 def plmn_code_to_operator_name(plmn_code: PlmnCode) -> OperatorName | None:
@@ -518,10 +660,10 @@ def plmn_code_to_operator_name(plmn_code: PlmnCode) -> OperatorName | None:
     OperatorName | None
         The operator name if found, otherwise None
     """
-    operator_plmn_mappings = get_operator_plmn_mappings()
-    return operator_plmn_mappings.get(plmn_code, plmn_code)
+    return get_operator_plmn_mappings().get(plmn_code, plmn_code)
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_operator_name_from_qnwinfo(qnwinfo: str) -> OperatorName | None:
     """Extract the operator name from a +QNWINFO response string.
 
@@ -535,6 +677,7 @@ def extract_operator_name_from_qnwinfo(qnwinfo: str) -> OperatorName | None:
     OperatorName | None
         The extracted operator name, or None if not found
     """
+    # Cached: a modem reports the same few +QNWINFO strings over and over
     plmn_code = extract_plmn_code_from_qnwinfo(qnwinfo)
     if plmn_code:
         return plmn_code_to_operator_name(plmn_code)
@@ -555,13 +698,11 @@ def get_link_operator_from_qnwinfo(payload: PayloadDatabase.RawPayload) -> Opera
         The operator name if found, otherwise None
     """
     qnwinfo = payload.get('qnwinfo')
-    match qnwinfo:
-        case [str() as v]:
-            return extract_operator_name_from_qnwinfo(v)
-        case str() as v:
-            return extract_operator_name_from_qnwinfo(v)
-        case _:
-            return None
+    if isinstance(qnwinfo, (list, tuple)) and len(qnwinfo) == 1:
+        qnwinfo = qnwinfo[0]
+    if isinstance(qnwinfo, str):
+        return extract_operator_name_from_qnwinfo(qnwinfo)
+    return None
 
 
 LinkDates = NewType('LinkDates', pd.DataFrame)
@@ -582,144 +723,139 @@ def get_link_dates(sensors: Sensors, control_center: ControlCenterApi) -> LinkDa
     pd.DataFrame
         DataFrame with columns: human_name, prod_name, link_date
     """
-    link_dates: list[dict] = []
+    # One control center request per distinct sensor
+    sensor_human_names = sensors['human_name'].dropna().unique().tolist()
+    sensors_all_things = control_center.get_sensors_all_things(
+        sensor_human_names)
+    pairs = [
+        (human_name, thing['id'])
+        for human_name, all_things in zip(sensor_human_names, sensors_all_things, strict=True)
+        for thing in all_things
+    ]
+
     payload_db = PayloadDatabase()
-    for human_name in sensors['human_name']:
-        all_things = control_center.get_sensor_all_things(human_name)
-        for thing in all_things:
-            prod_number = thing['id']
-            first_payload = payload_db.get_first_payload(
-                human_name, prod_number)
-            last_payload = payload_db.get_last_payload(
-                human_name, prod_number)
-
-            link_dates.append({
-                'human_name': human_name,
-                'prod_name': prod_number,
-                'link_date': get_timestamp(first_payload) if first_payload else None,
-                'link_operator': get_link_operator_from_qnwinfo(
-                    first_payload) if first_payload else None,
-                'unlink_date': get_timestamp(last_payload) if last_payload else None,
-            })
-
-    dataframe = pd.DataFrame(link_dates)
+    payloads = payload_db.get_first_last_payloads_bulk(pairs)
+
+    first_payloads = [first_payload for first_payload, _ in payloads]
+    last_payloads = [last_payload for _, last_payload in payloads]
+
+    # One comprehension per column
+    dataframe = pd.DataFrame({
+        'human_name': pd.Categorical([human_name for human_name, _ in pairs]),
+        'prod_name': pd.array([prod_number for _, prod_number in pairs], dtype=ARROW_STRING_DTYPE),
+        'link_date': [payload['time_stamp'] if payload else None for payload in first_payloads],
+        'link_operator': pd.Categorical([
+            get_link_operator_from_qnwinfo(payload) if payload else None for payload in first_payloads]),
+        'unlink_date': [payload['time_stamp'] if payload else None for payload in last_payloads],
+    })
     dataframe = dataframe.sort_values(by='human_name')
     return LinkDates(dataframe)
 
 
-def add_sensor_link_date(things: Things, link_dates: LinkDates) -> Things:
-    """Add link date column to things DataFrame using link_dates.
+LinkDatesSummary = NewType('LinkDatesSummary', pd.DataFrame)
+
+
+def summarize_link_dates(link_dates: LinkDates) -> LinkDatesSummary:
+    """Aggregate link dates per prod_name with a single sort of link_dates.
 
     Parameters
     ----------
-    things : Things
-        DataFrame containing things data
     link_dates : LinkDates
         DataFrame containing link dates for sensors and things
 
     Returns
     -------
-    Things
-        DataFrame with activation date column added
-    -------
-    None
+    LinkDatesSummary
+        DataFrame indexed by prod_name with columns: first_link_date,
+        last_link_date, last_link_operator, last_unlink_date
     """
-    latest_link_dates = (
-        link_dates
-        .sort_values('link_date', ascending=False)
-        .drop_duplicates(subset=['human_name'], keep='first')
-        .drop(columns=['human_name', 'unlink_date'])
-    )
+    # Oldest link first, missing link dates last
+    by_link_date = link_dates.sort_values('link_date')
 
+    first_link_dates = (
+        by_link_date
+        .drop_duplicates(subset=['prod_name'], keep='first')
+        .set_index('prod_name')['link_date']
+        .rename('first_link_date')
+    )
 
-    things_merged = things.merge(
-        latest_link_dates, on='prod_name', how='left')
-    return things_merged.rename(columns={'link_operator': 'last_link_operator', 'link_date': 'last_link_date'})
-
-
-def add_last_unlink_date(things: Things, link_dates: LinkDates) -> Things:
-    """Add last link date column to things DataFrame using the latest link date per prod_name.
-
-    Parameters
-    ----------
-    things : Things
-        DataFrame containing things data
-    link_dates : LinkDates
-        DataFrame containing link dates for sensors and things
+    # Latest link of each sensor, i.e. the thing currently attached to it
+    last_links = (
+        by_link_date
+        .dropna(subset=['link_date'])
+        .drop_duplicates(subset=['human_name'], keep='last')
+        .drop_duplicates(subset=['prod_name'], keep='last')
+        .set_index('prod_name')[['link_date', 'link_operator']]
+        .rename(columns={'link_date': 'last_link_date', 'link_operator': 'last_link_operator'})
+    )
 
-    Returns
-    -------
-    Things
-        DataFrame with last link date column added
-    """
-    # Keep only the latest unlink_date for each prod_name
-    latest_unlink_dates = (
+    # The max of unlink dates doesn't need the link_date order, nor sorted
+    # group keys since the result is only joined on prod_name
+    last_unlink_dates = (
         link_dates
-        .sort_values('unlink_date', ascending=False)
-        .drop_duplicates(subset=['prod_name'], keep='first')
-        .rename(columns={'unlink_date': 'last_unlink_date'})
+        .dropna(subset=['unlink_date'])
+        .groupby('prod_name', sort=False)['unlink_date']
+        .max()
+        .rename('last_unlink_date')
     )
 
-    return things.merge(
-        latest_unlink_dates[['prod_name', 'last_unlink_date']],
-        on='prod_name',
-        how='left',
+    return LinkDatesSummary(
+        first_link_dates.to_frame()
+        .join(last_links)
+        .join(last_unlink_dates),
     )
 
 
-def add_first_link_date(things: Things, link_dates: LinkDates) -> Things:
-    """Add first link date column to things DataFrame using the oldest link date per prod_name.
+def add_link_date_columns(things: Things, link_dates_summary: LinkDatesSummary) -> Things:
+    """Add link date columns to things DataFrame with a single merge.
 
     Parameters
     ----------
     things : Things
         DataFrame containing things data
-    link_dates : LinkDates
-        DataFrame containing link dates for sensors and things
+    link_dates_summary : LinkDatesSummary
+        Link dates aggregated per prod_name by summarize_link_dates
 
     Returns
     -------
     Things
-        DataFrame with first link date column added
+        DataFrame with last_link_date, last_link_operator, first_link_date
+        and last_unlink_date columns added
     """
-    # Keep only the oldest link_date for each prod_name
-    oldest_link_dates = (
-        link_dates
-        .sort_values('link_date')
-        .drop_duplicates(subset=['prod_name'], keep='first')
-        .rename(columns={'link_date': 'first_link_date'})
-    )
-
     return things.merge(
-        oldest_link_dates[['prod_name', 'first_link_date']],
-        on='prod_name',
+        link_dates_summary[['last_link_date', 'last_link_operator',
+                            'first_link_date', 'last_unlink_date']],
+        left_on='prod_name',
+        right_index=True,
         how='left',
     )
 
 
+CSV_CHUNK_SIZE = 10_000
+
+
 def main() -> NoReturn:  # pragma: no cover
     """Entry point."""
     credentials = ControlCenterCredentials.from_env()
-    control_center = ControlCenterApi(credentials)
-
-    things = things_to_dataframe(control_center.list_things())
-    add_version_column(things)
-    add_feature_columns(things)
-    things.to_csv('things.csv', index=False, sep=';', encoding='utf-8')
+    with ControlCenterApi(credentials) as control_center:
+        things = things_to_dataframe(control_center.list_things())
+        add_version_column(things)
+        add_feature_columns(things)
 
-    sensors = sensors_to_dataframe(
-        control_center.get_sensors(args='thing,human_name'))
+        sensors = sensors_to_dataframe(
+            control_center.get_sensors(args='thing,human_name'))
 
-    things = add_human_name_column(things, sensors)
+        things = add_human_name_column(things, sensors)
 
-    # sensors = Sensors(sensors.head(20))
-    link_dates = get_link_dates(sensors, control_center)
-    link_dates.to_csv('link_dates.csv', index=False, sep=';', encoding='utf-8')
+        # sensors = Sensors(sensors.head(20))
+        link_dates = get_link_dates(sensors, control_center)
+    link_dates.to_parquet('link_dates.parquet', engine='pyarrow',
+                          compression='zstd', index=False)
 
-    things = add_sensor_link_date(things, link_dates)
-    things = add_first_link_date(things, link_dates)
-    things = add_last_unlink_date(things, link_dates)
-    things.to_csv('things.csv', index=False, sep=';', encoding='utf-8')
+    link_dates_summary = summarize_link_dates(link_dates)
+    things = add_link_date_columns(things, link_dates_summary)
+    things.to_csv('things.csv', index=False, sep=';',
+                  encoding='utf-8', chunksize=CSV_CHUNK_SIZE)
 
     sys.exit(0)
 
@@ -0,0 +1,75 @@
+import math
+
+import pandas as pd
+
+from build_initial_hubspot_data.main import (
+    ARROW_STRING_DTYPE,
+    LinkDates,
+    Things,
+    add_link_date_columns,
+    summarize_link_dates,
+)
+
+
+def make_link_dates(rows: list[tuple]) -> LinkDates:
+    human_names, prod_names, link_dates, link_operators, unlink_dates = zip(*rows, strict=True)
+    return LinkDates(pd.DataFrame({
+        'human_name': pd.Categorical(human_names),
+        'prod_name': pd.array(prod_names, dtype=ARROW_STRING_DTYPE),
+        'link_date': link_dates,
+        'link_operator': pd.Categorical(link_operators),
+        'unlink_date': unlink_dates,
+    }))
+
+
+def test_summarize_link_dates_per_prod_name() -> None:
+    summary = summarize_link_dates(make_link_dates([
+        ('s1', 'p1', 100, 'Orange', 200),
+        ('s1', 'p2', 400, 'SFR', 500),
+        ('s2', 'p1', 300, 'Free', 250),
+    ]))
+
+    assert sorted(summary.index) == ['p1', 'p2']
+    assert summary.loc['p1', 'first_link_date'] == 100
+    assert summary.loc['p1', 'last_unlink_date'] == 250
+    # p1 is the current thing of s2 only, s1 has moved on to p2
+    assert summary.loc['p1', 'last_link_date'] == 300
+    assert summary.loc['p1', 'last_link_operator'] == 'Free'
+    assert summary.loc['p2', 'first_link_date'] == 400
+    assert summary.loc['p2', 'last_link_date'] == 400
+    assert summary.loc['p2', 'last_link_operator'] == 'SFR'
+    assert summary.loc['p2', 'last_unlink_date'] == 500
+
+
+def test_thing_last_linked_by_two_sensors_has_single_row() -> None:
+    summary = summarize_link_dates(make_link_dates([
+        ('s1', 'p1', 100, 'Orange', 200),
+        ('s2', 'p1', 300, 'Free', 400),
+    ]))
+
+    assert list(summary.index) == ['p1']
+    assert summary.loc['p1', 'first_link_date'] == 100
+    # The most recent of the two links wins
+    assert summary.loc['p1', 'last_link_date'] == 300
+    assert summary.loc['p1', 'last_link_operator'] == 'Free'
+    assert summary.loc['p1', 'last_unlink_date'] == 400
+
+    things = Things(pd.DataFrame({'prod_name': pd.array(['p1', 'p2'], dtype=ARROW_STRING_DTYPE)}))
+    things = add_link_date_columns(things, summary)
+
+    assert len(things) == 2
+    assert things['last_link_date'].tolist()[0] == 300
+
+
+def test_sensor_without_link_dates() -> None:
+    summary = summarize_link_dates(make_link_dates([
+        ('s1', 'p1', 100, 'Orange', 200),
+        ('s2', 'p2', None, None, None),
+    ]))
+
+    assert sorted(summary.index) == ['p1', 'p2']
+    assert summary.loc['p1', 'last_link_date'] == 100
+    assert math.isnan(summary.loc['p2', 'first_link_date'])
+    assert math.isnan(summary.loc['p2', 'last_link_date'])
+    assert pd.isna(summary.loc['p2', 'last_link_operator'])
+    assert math.isnan(summary.loc['p2', 'last_unlink_date'])
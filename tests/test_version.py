@@ -0,0 +1,63 @@
+import pandas as pd
+import pytest
+
+from build_initial_hubspot_data.main import (
+    ARROW_STRING_DTYPE,
+    Things,
+    add_feature_columns,
+    add_version_column,
+    extract_version_from_serial,
+)
+
+SERIAL_VERSIONS = [
+    ('muvtx_022_fr', '2.2'),
+    ('muvtx_105_', '0.5'),
+    # Prefix not at the start
+    ('fr_muvtx_031_x', '3.1'),
+    # Non-digit triplet, then a valid second prefix
+    ('muvtx_0a2_x_muvtx_012_', '1.2'),
+    # Prefix inside the prefix
+    ('muvtx_muvtx_045_', '4.5'),
+    # Only the first valid prefix counts
+    ('muvtx_012_muvtx_034_', '1.2'),
+    # Only ASCII digits are version digits
+    ('muvtx_0٣٤_', None),
+    ('muvtx_01_', None),
+    ('muvtx_0123_', None),
+    ('muvtx_012', None),
+    ('MUVTX_012_', None),
+    ('', None),
+    (None, None),
+]
+
+
+def make_things(serial_numbers: list[str | None]) -> Things:
+    return Things(pd.DataFrame({
+        'serial_number': pd.array(serial_numbers, dtype=ARROW_STRING_DTYPE),
+    }))
+
+
+@pytest.mark.parametrize(('serial_number', 'expected'), SERIAL_VERSIONS)
+def test_extract_version_from_serial(serial_number: str, expected: str | None) -> None:
+    assert extract_version_from_serial(serial_number) == expected
+
+
+def test_add_version_column_matches_extract_version_from_serial() -> None:
+    serial_numbers = [serial_number for serial_number, _ in SERIAL_VERSIONS]
+    things = make_things(serial_numbers)
+
+    add_version_column(things)
+
+    versions = [None if pd.isna(version) else version for version in things['version']]
+    assert versions == [extract_version_from_serial(serial_number) for serial_number in serial_numbers]
+    assert versions == [expected for _, expected in SERIAL_VERSIONS]
+
+
+def test_add_feature_columns_from_version() -> None:
+    things = make_things(['muvtx_022_fr', 'muvtx_011_fr', 'muvtx_0٣٤_'])
+
+    add_version_column(things)
+    add_feature_columns(things)
+
+    assert things['hauteur'].tolist() == ['Oui', 'Oui', 'Non']
+    assert things['temperature'].tolist() == ['Oui', 'Non', 'Non']